@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 import datetime
 import uuid
 from functools import lru_cache
+from operator import attrgetter
 from typing import Optional, Sequence, Tuple
 
 from django.conf import settings
@@ -16,6 +17,8 @@ from django.db.models import (
     CheckConstraint,
     Count,
     DateField,
+    Exists,
+    ExpressionWrapper,
     F,
     Max,
     Min,
@@ -299,6 +302,8 @@ class AnimalManager(models.Manager):
         species = sire.species
         if species != dam.species:
             raise ValueError(_("sire and dam species do not match"))
+        if sire.pk == dam.pk:
+            raise ValueError(_("sire and dam must be different animals"))
         animal = self.create_with_event(
             species,
             date=date,
@@ -308,8 +313,10 @@ class AnimalManager(models.Manager):
             description=description,
             **animal_properties,
         )
-        animal.parents.set([sire, dam])
-        animal.save()
+        # a new animal has no parents yet, so skip the lookups in parents.set()
+        Parent.objects.bulk_create(
+            [Parent(child=animal, parent=parent) for parent in (sire, dam)]
+        )
         return animal
 
 
@@ -370,11 +377,50 @@ class AnimalQuerySet(models.QuerySet):
             ),
         )
 
-    def with_child_counts(self):
-        # TODO fix me - slow
+    def with_child_counts(self, on_date: Optional[datetime.date] = None):
+        """Annotate the birds with the number of children that hatched (as of date)"""
+        refdate = on_date or datetime.date.today()
+        return self.annotate(
+            n_children=Coalesce(
+                Subquery(
+                    Parent.objects.filter(
+                        parent=OuterRef("pk"),
+                        child__event__status__name=BIRTH_EVENT_NAME,
+                        child__event__date__lte=refdate,
+                    )
+                    .order_by()
+                    .values("parent")
+                    .annotate(n=Count("child", distinct=True))
+                    .values("n")
+                ),
+                0,
+            )
+        )
+
+    def with_expected_hatch(self):
+        """Annotate the birds with the expected hatch date (see
+        Animal.expected_hatch), which this will mask. Avoids three queries per
+        egg when listing eggs.
+
+        """
+        laid_on = (
+            Event.objects.filter(
+                animal=OuterRef("pk"), status__name=UNBORN_CREATION_EVENT_NAME
+            )
+            .order_by("date")
+            .values("date")[:1]
+        )
+        added_or_removed = Event.objects.filter(
+            Q(status__adds=True) | Q(status__removes=True), animal=OuterRef("pk")
+        )
         return self.annotate(
-            n_children=Count(
-                "children", filter=Q(children__event__status=get_birth_event_type())
+            expected_hatch=Case(
+                When(Exists(added_or_removed), then=None),
+                default=ExpressionWrapper(
+                    Subquery(laid_on) + F("species__incubation_days"),
+                    output_field=DateField(),
+                ),
+                output_field=DateField(),
             )
         )
 
@@ -576,19 +622,15 @@ class Animal(models.Model):
         else:
             age = self.died_on - self.born_on
         age_days = age.days
-        # faster to do this lookup in python if age_set is prefetched
-        groups = sorted(
-            filter(
-                lambda ag: ag.min_days <= age_days,
-                self.species.age_set.all(),
-            ),
-            key=lambda ag: ag.min_days,
-            reverse=True,
+        # faster to do this lookup in python if age_set is prefetched. The
+        # oldest group the animal qualifies for is a single pass, no sort needed
+        group = max(
+            (ag for ag in self.species.age_set.all() if ag.min_days <= age_days),
+            key=attrgetter("min_days"),
+            default=None,
         )
-        try:
-            return groups[0].name
-        except IndexError:
-            pass
+        if group is not None:
+            return group.name
 
     def expected_hatch(self):
         """For eggs, expected hatch date. None if not an egg, lost, already
@@ -768,6 +810,22 @@ class EventQuerySet(models.QuerySet):
             "entered_by",
         )
 
+    def with_age(self):
+        """Annotate the events with the age of the animal on the date of the event"""
+        return self.annotate(
+            born_on=Subquery(
+                Event.objects.filter(
+                    animal=OuterRef("animal"), status__name=BIRTH_EVENT_NAME
+                )
+                .order_by("date")
+                .values("date")[:1]
+            ),
+            age=Case(
+                When(born_on__lte=F("date"), then=F("date") - F("born_on")),
+                default=None,
+            ),
+        )
+
     def has_location(self):
         return self.exclude(location__isnull=True)
 
@@ -814,7 +872,10 @@ class Event(models.Model):
         return f"{self.status} on {self.date:%b %-d, %Y}"
 
     def age(self):
-        """Age of the animal at the time of the event, or None if birthday not known"""
+        """Age of the animal at the time of the event, or None if birthday not
+        known. This method is masked if with_age() is used on the queryset.
+
+        """
         events = self.animal.event_set.filter(status=get_birth_event_type())
         if events:
             evt_birth = events.earliest()
@@ -1045,12 +1106,17 @@ class Pairing(models.Model):
         """
         end_date = on_date or self.ended_on or datetime.date.today()
         qs = Event.objects.filter(
-            animal__in=(self.sire, self.dam),
+            animal__in=(self.sire_id, self.dam_id),
             date__gte=self.began_on,
             date__lte=end_date,
         )
         try:
-            return qs.exclude(location__isnull=True).latest().location
+            return (
+                qs.exclude(location__isnull=True)
+                .select_related("location")
+                .latest()
+                .location
+            )
         except (AttributeError, Event.DoesNotExist):
             return None
 
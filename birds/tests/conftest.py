@@ -0,0 +1,52 @@
+import pytest
+from django.core.management import call_command
+
+from birds.models import (
+    Age,
+    Color,
+    Location,
+    Measure,
+    Plumage,
+    SampleLocation,
+    SampleType,
+    Species,
+    Status,
+)
+
+STARTER_KIT = "bird_colony_starter_kit"
+# the models in the starter kit, in an order that is safe for deleting them
+STARTER_KIT_MODELS = (
+    Age,
+    Species,
+    Status,
+    Plumage,
+    Location,
+    SampleType,
+    SampleLocation,
+    Color,
+    Measure,
+)
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Load the starter kit once per test database instead of once per class"""
+    with django_db_blocker.unblock():
+        call_command("loaddata", STARTER_KIT, verbosity=0)
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _without_starter_kit(request, django_db_setup, django_db_blocker):
+    """Remove the starter kit for test classes marked `without_starter_kit` and
+    load it again when the class is done.
+
+    """
+    if request.node.get_closest_marker("without_starter_kit") is None:
+        yield
+        return
+    with django_db_blocker.unblock():
+        for model in STARTER_KIT_MODELS:
+            model.objects.all().delete()
+    yield
+    with django_db_blocker.unblock():
+        call_command("loaddata", STARTER_KIT, verbosity=0)
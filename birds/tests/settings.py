@@ -8,6 +8,8 @@ DATABASES = {
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD', 'postgres'),
         'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
         'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # the test database is disposable, so don't wait on WAL flushes
+        'OPTIONS': {'options': '-c synchronous_commit=off'},
     }
 }
 
@@ -27,6 +29,9 @@ INSTALLED_APPS = [
 
 SECRET_KEY = 'django-insecure-test-key-not-for-production'
 
+# fast hashing for test users; never use this outside of tests
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # -*- mode: python -*-
 import datetime
-import warnings
 
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -17,13 +16,10 @@ from birds.models import (
     Species,
 )
 
-warnings.filterwarnings("error")
 User = get_user_model()
 
 
 class ApiViewTests(APITestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def setUp(self):
         self.species = Species.objects.get(pk=1)
         self.sire = Animal.objects.create(species=self.species, sex=Animal.Sex.MALE)
@@ -171,7 +167,7 @@ class ApiViewTests(APITestCase):
         date = datetime.date.today()
         value = 12.1
         measure = Measure.objects.get(name="weight")
-        self.client.login(username="testuser1", password="testpass")
+        self.client.force_login(self.user)
         response = self.client.post(
             reverse("birds:events_api"),
             {
@@ -194,7 +190,7 @@ class ApiViewTests(APITestCase):
         event = bird.event_set.first()
         value = 12.1
         measure = Measure.objects.get(name="weight")
-        self.client.login(username="testuser1", password="testpass")
+        self.client.force_login(self.user)
         measurement = {
             "measure": measure.name,
             "value": value,
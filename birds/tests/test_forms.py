@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 # -*- mode: python -*-
 import datetime
-import warnings
 from unittest import skip
 
+import pytest
 from django.forms import formset_factory
 from django.test import TestCase
 
@@ -27,8 +27,6 @@ from birds.models import (
     Status,
 )
 
-warnings.filterwarnings("error")
-
 
 def today() -> datetime.date:
     return datetime.date.today()
@@ -38,6 +36,7 @@ def dt_days(days: int) -> datetime.timedelta:
     return datetime.timedelta(days=days)
 
 
+@pytest.mark.without_starter_kit
 class SexFormTest(TestCase):
     def test_without_note_status(self):
         user = models.get_sentinel_user()
@@ -51,6 +50,7 @@ class SexFormTest(TestCase):
         self.assertTrue(form.is_valid())
 
 
+@pytest.mark.without_starter_kit
 class ReservationFormTest(TestCase):
     def test_without_reservation_status(self):
         user = models.get_sentinel_user()
@@ -69,6 +69,7 @@ class ReservationFormTest(TestCase):
         self.assertTrue(form.is_valid())
 
 
+@pytest.mark.without_starter_kit
 class NewBandFormTest(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -143,8 +144,6 @@ class NewBandFormTest(TestCase):
 
 
 class NewAnimalFormTest(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     @classmethod
     def setUpTestData(cls):
         status = models.get_birth_event_type()
@@ -286,8 +285,6 @@ class NewAnimalFormTest(TestCase):
 
 
 class NewPairingFormTest(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     @classmethod
     def setUpTestData(cls):
         birthday = today() - dt_days(365)
@@ -430,8 +427,6 @@ class NewPairingFormTest(TestCase):
 
 
 class BreedingCheckFormTest(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     @classmethod
     def setUpTestData(cls):
         birthday = today() - dt_days(365)
@@ -616,8 +611,6 @@ class BreedingCheckFormTest(TestCase):
 
 
 class BreedingCheckNewPairingFormTest(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     @classmethod
     def setUpTestData(cls):
         birthday = today() - dt_days(365)
@@ -43,8 +43,6 @@ def dt_days(days: int) -> datetime.timedelta:
 
 
 class AnimalModelTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def test_create_bird_with_event(self):
         species = Species.objects.get(pk=1)
         status = models.get_birth_event_type()
@@ -272,6 +270,10 @@ class AnimalModelTests(TestCase):
         self.assertIs(egg.age(), None)
         eggspected_hatch = laid_on + datetime.timedelta(days=species.incubation_days)
         self.assertEqual(egg.expected_hatch(), eggspected_hatch)
+        self.assertEqual(
+            Animal.objects.with_expected_hatch().get(pk=egg.pk).expected_hatch,
+            eggspected_hatch,
+        )
 
         annotated_egg = Animal.objects.with_dates().get(pk=egg.pk)
         self.assertEqual(annotated_egg.first_event_on, laid_on)
@@ -309,6 +311,9 @@ class AnimalModelTests(TestCase):
         self.assertIs(
             egg.expected_hatch(), None, "lost egg should not have expected hatch"
         )
+        self.assertIs(
+            Animal.objects.with_expected_hatch().get(pk=egg.pk).expected_hatch, None
+        )
 
         annotated_egg = Animal.objects.with_dates().get(pk=egg.pk)
         self.assertEqual(annotated_egg.first_event_on, laid_on)
@@ -537,8 +542,6 @@ class AnimalModelTests(TestCase):
 
 
 class ParentModelTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def test_bird_parents(self):
         species = Species.objects.get(pk=1)
         sire = Animal.objects.create(species=species, sex=Animal.Sex.MALE)
@@ -573,16 +576,18 @@ class ParentModelTests(TestCase):
         birthday = today() - age
         user = models.get_sentinel_user()
         location = Location.objects.get(pk=2)
-        bird = Animal.objects.create_from_parents(
-            sire=sire,
-            dam=dam,
-            date=birthday,
-            status=status,
-            entered_by=user,
-            location=location,
-            description="testing 123",
-            sex=Animal.Sex.FEMALE,
-        )
+        # one insert each for the animal, its event, and its parents
+        with self.assertNumQueries(3):
+            bird = Animal.objects.create_from_parents(
+                sire=sire,
+                dam=dam,
+                date=birthday,
+                status=status,
+                entered_by=user,
+                location=location,
+                description="testing 123",
+                sex=Animal.Sex.FEMALE,
+            )
         self.assertEqual(bird.age(), age)
         self.assertEqual(bird.sex, Animal.Sex.FEMALE)
         self.assertEqual(bird.event_set.count(), 1)
@@ -595,16 +600,46 @@ class ParentModelTests(TestCase):
         self.assertTrue(sire.children.contains(bird))
         self.assertTrue(dam.children.contains(bird))
 
+    def test_create_bird_from_same_parent(self):
+        species = Species.objects.get(pk=1)
+        parent = Animal.objects.create(species=species, sex=Animal.Sex.MALE)
+        n_animals = Animal.objects.count()
+        n_events = Event.objects.count()
+        with self.assertRaises(ValueError):
+            Animal.objects.create_from_parents(
+                sire=parent,
+                dam=parent,
+                date=today(),
+                status=models.get_birth_event_type(),
+                entered_by=models.get_sentinel_user(),
+                location=Location.objects.get(pk=2),
+            )
+        self.assertEqual(Animal.objects.count(), n_animals)
+        self.assertEqual(Event.objects.count(), n_events)
+
     def test_bird_child_counts(self):
         species = Species.objects.get(pk=1)
         sire = Animal.objects.create(species=species, sex=Animal.Sex.MALE)
         dam = Animal.objects.create(species=species, sex=Animal.Sex.FEMALE)
         age = dt_days(5)
         birthday = today() - age
-        make_child(sire, dam, birthday)
+        child = make_child(sire, dam, birthday)
         self.assertEqual(sire.children.unhatched().count(), 0)
         self.assertEqual(sire.children.hatched().count(), 1)
         self.assertEqual(sire.children.alive().count(), 1)
+        # eggs are not counted
+        Animal.objects.create_from_parents(
+            sire=sire,
+            dam=dam,
+            date=today(),
+            status=models.get_unborn_creation_event_type(),
+            entered_by=models.get_sentinel_user(),
+            location=Location.objects.get(pk=2),
+        )
+        counts = Animal.objects.with_child_counts().in_bulk([sire.pk, dam.pk, child.pk])
+        self.assertEqual(counts[sire.pk].n_children, 1)
+        self.assertEqual(counts[dam.pk].n_children, 1)
+        self.assertEqual(counts[child.pk].n_children, 0)
 
     def test_genealogy(self):
         species = Species.objects.get(pk=1)
@@ -707,8 +742,6 @@ class ParentModelTests(TestCase):
 
 
 class EventModelTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def test_age_at_event_time(self):
         species = Species.objects.get(pk=1)
         bird = Animal.objects.create(species=species)
@@ -744,6 +777,32 @@ class EventModelTests(TestCase):
         )
         self.assertEqual(event_2.age(), None)
 
+    def test_age_annotation(self):
+        species = Species.objects.get(pk=1)
+        bird = Animal.objects.create(species=species)
+        egg = Animal.objects.create(species=species)
+        user = models.get_sentinel_user()
+        birthday = today() - dt_days(5)
+        status = Status.objects.get(name="moved")
+        before = Event.objects.create(
+            animal=bird, status=status, date=birthday - dt_days(1), entered_by=user
+        )
+        Event.objects.create(
+            animal=bird,
+            status=models.get_birth_event_type(),
+            date=birthday,
+            entered_by=user,
+        )
+        after = Event.objects.create(
+            animal=bird, status=status, date=today(), entered_by=user
+        )
+        unhatched = Event.objects.create(
+            animal=egg, status=status, date=today(), entered_by=user
+        )
+        events = Event.objects.with_age().in_bulk()
+        for event in (before, after, unhatched):
+            self.assertEqual(events[event.pk].age, event.age())
+
     def test_most_recent_event(self):
         species = Species.objects.get(pk=1)
         bird_1 = Animal.objects.create(species=species)
@@ -831,8 +890,6 @@ class EventModelTests(TestCase):
 
 
 class PairingModelTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     @classmethod
     def setUpTestData(cls):
         species = Species.objects.get(pk=1)
@@ -1459,8 +1516,6 @@ class PairingModelTests(TestCase):
 
 
 class LocationModelTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def test_location_birds(self):
         location = Location.objects.get(pk=2)
         self.assertFalse(location.birds().exists())
@@ -1590,8 +1645,6 @@ class LocationModelTests(TestCase):
 
 
 class MeasurementModelTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def test_no_duplicate_measurements(self):
         species = Species.objects.get(pk=1)
         bird = Animal.objects.create(species=species)
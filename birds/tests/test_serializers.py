@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # -*- mode: python -*-
 import datetime
-import warnings
 
 from django.test import TestCase
 
@@ -11,12 +10,8 @@ from birds.serializers import (
     EventSerializer,
 )
 
-warnings.filterwarnings("error")
-
 
 class EventSerializerTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
-
     def setUp(self):
         self.species = Species.objects.get(pk=1)
         self.bird = Animal.objects.create(species=self.species, sex=Animal.Sex.MALE)
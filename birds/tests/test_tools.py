@@ -2,7 +2,9 @@
 # -*- mode: python -*-
 import datetime
 
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 
 from birds import models, tools
 from birds.models import (
@@ -15,9 +17,21 @@ from birds.models import (
 )
 
 
-class TabulatePairsTests(TestCase):
-    fixtures = ["bird_colony_starter_kit"]
+class SortAndGroupTests(SimpleTestCase):
+    def test_groups_are_lists(self):
+        groups = tools.sort_and_group([3, 1, 2, 11], key=lambda x: x % 2)
+        self.assertEqual(groups, [(0, [2]), (1, [3, 1, 11])])
+
+
+class FindFirstTests(SimpleTestCase):
+    def test_first_match(self):
+        self.assertEqual(tools.find_first([1, 4, 6], lambda x: x % 2 == 0), 4)
+
+    def test_no_match(self):
+        self.assertIsNone(tools.find_first([1, 3], lambda x: x % 2 == 0))
+
 
+class TabulatePairsTests(TestCase):
     @classmethod
     def setUpTestData(cls):
         birthday = datetime.date.today() - datetime.timedelta(days=365)
@@ -192,3 +206,155 @@ class TabulatePairsTests(TestCase):
         pair_data = data[0]
         self.assertEqual(pair_data["pair"], pair)
         self.assertEqual(pair_data["location"], self.nest)
+
+    def assertMatchesPairing(self, dates, pair_data):
+        """The tabulated location and eggs agree with the Pairing methods"""
+        pair = pair_data["pair"]
+        until = dates[-1]
+        self.assertEqual(pair_data["location"], pair.last_location(until))
+        # no eggs are lost, so all of them are counted on the last active day
+        last_day = dates.index(min(until, pair.ended_on or until))
+        counts = pair_data["counts"][last_day]
+        self.assertEqual(sum(counts.values()), pair.eggs().count())
+
+    def test_ended_pair_matches_pairing_methods(self):
+        user = models.get_sentinel_user()
+        until = datetime.date.today()
+        since = until - datetime.timedelta(days=4)
+        status_laid = models.get_unborn_creation_event_type()
+        aviary = Location.objects.get(pk=1)
+        pair = Pairing.objects.create_with_events(
+            sire=self.sire,
+            dam=self.dam,
+            began_on=since,
+            purpose="testing",
+            entered_by=user,
+            location=self.nest,
+        )
+        Animal.objects.create_from_parents(
+            sire=self.sire,
+            dam=self.dam,
+            date=since + datetime.timedelta(days=1),
+            status=status_laid,
+            entered_by=user,
+            location=self.nest,
+        )
+        pair.close(since + datetime.timedelta(days=2), user, location=aviary)
+        # laid after the pair ended, so not one of its eggs
+        Animal.objects.create_from_parents(
+            sire=self.sire,
+            dam=self.dam,
+            date=since + datetime.timedelta(days=3),
+            status=status_laid,
+            entered_by=user,
+            location=aviary,
+        )
+        dates, data = tools.tabulate_pairs(since, until)
+        self.assertEqual(len(data), 1)
+        pair_data = data[0]
+        self.assertMatchesPairing(dates, pair_data)
+        self.assertEqual(pair_data["location"], aviary)
+        self.assertDictEqual(pair_data["counts"][2], {"egg": 1})
+        self.assertDictEqual(pair_data["counts"][3], {})
+
+    def test_shared_sire_matches_pairing_methods(self):
+        user = models.get_sentinel_user()
+        until = datetime.date.today()
+        since = until - datetime.timedelta(days=4)
+        status_laid = models.get_unborn_creation_event_type()
+        dam_2 = Animal.objects.create_with_event(
+            species=self.dam.species,
+            status=models.get_birth_event_type(),
+            date=since - datetime.timedelta(days=365),
+            entered_by=user,
+            location=Location.objects.get(pk=1),
+            sex=Animal.Sex.FEMALE,
+            band_number=3,
+        )
+        pair_1 = Pairing.objects.create_with_events(
+            sire=self.sire,
+            dam=self.dam,
+            began_on=since,
+            purpose="testing",
+            entered_by=user,
+            location=self.nest,
+        )
+        Animal.objects.create_from_parents(
+            sire=self.sire,
+            dam=self.dam,
+            date=since + datetime.timedelta(days=1),
+            status=status_laid,
+            entered_by=user,
+            location=self.nest,
+        )
+        pair_1.close(since + datetime.timedelta(days=2), user)
+        pair_2 = Pairing.objects.create_with_events(
+            sire=self.sire,
+            dam=dam_2,
+            began_on=since + datetime.timedelta(days=2),
+            purpose="testing",
+            entered_by=user,
+            location=self.nest,
+        )
+        for day in (3, 4):
+            Animal.objects.create_from_parents(
+                sire=self.sire,
+                dam=dam_2,
+                date=since + datetime.timedelta(days=day),
+                status=status_laid,
+                entered_by=user,
+                location=self.nest,
+            )
+        dates, data = tools.tabulate_pairs(since, until)
+        self.assertEqual([pair_data["pair"] for pair_data in data], [pair_2, pair_1])
+        for pair_data in data:
+            self.assertMatchesPairing(dates, pair_data)
+        self.assertDictEqual(data[0]["counts"][-1], {"egg": 2})
+        self.assertDictEqual(data[1]["counts"][2], {"egg": 1})
+
+    def test_query_count_independent_of_number_of_pairs(self):
+        user = models.get_sentinel_user()
+        until = datetime.date.today()
+        since = until - datetime.timedelta(days=3)
+        species = Species.objects.get(pk=1)
+
+        def make_parent(sex, band_number):
+            return Animal.objects.create_with_event(
+                species=species,
+                status=models.get_birth_event_type(),
+                date=since - datetime.timedelta(days=365),
+                entered_by=user,
+                location=self.nest,
+                sex=sex,
+                band_number=band_number,
+            )
+
+        n_queries = []
+        for sire_band, dam_band in ((3, 4), (5, 6)):
+            sire = make_parent(Animal.Sex.MALE, sire_band)
+            dam = make_parent(Animal.Sex.FEMALE, dam_band)
+            Pairing.objects.create_with_events(
+                sire=sire,
+                dam=dam,
+                began_on=since,
+                purpose="testing",
+                entered_by=user,
+                location=self.nest,
+            )
+            Animal.objects.create_from_parents(
+                sire=sire,
+                dam=dam,
+                date=until,
+                status=models.get_unborn_creation_event_type(),
+                entered_by=user,
+                location=self.nest,
+            )
+            with CaptureQueriesContext(connection) as queries:
+                dates, data = tools.tabulate_pairs(since, until)
+            n_queries.append(len(queries))
+            for pair_data in data:
+                self.assertEqual(pair_data["location"], self.nest)
+                self.assertDictEqual(pair_data["counts"][-1], {"egg": 1})
+        self.assertEqual(len(data), 2)
+        # pairs, progeny (+ age prefetch), parent links, parent locations
+        self.assertEqual(n_queries, [5, 5])
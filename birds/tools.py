@@ -2,23 +2,25 @@
 # -*- mode: python -*-
 """ Tools for classifying birds and computing summaries """
 import datetime
-from collections import Counter
+from collections import Counter, defaultdict
+from itertools import groupby
 
-from birds.models import Pairing
+from django.db.models import Prefetch, Subquery
 
+from birds.models import Age, Animal, Event, Pairing, Parent
 
-def sort_and_group(qs, key):
-    """Sort and group a queryset by a key function"""
-    from itertools import groupby
 
-    return groupby(sorted(qs, key=key), key)
+def sort_and_group(qs, key):
+    """Sort and group a queryset by a key function. Returns a list of (key,
+    items) tuples."""
+    items = list(qs)
+    items.sort(key=key)
+    return [(k, list(group)) for k, group in groupby(items, key)]
 
 
 def find_first(iterable, predicate):
     """Return the first item in iterable that matches predicate, or None if no match"""
-    for item in iterable:
-        if predicate(item):
-            return item
+    return next(filter(predicate, iterable), None)
 
 
 def tabulate_pairs(
@@ -36,21 +38,84 @@ def tabulate_pairs(
     if since > until:
         raise ValueError("until must be after since")
     n_days = (until - since).days + 1
-    dates = dates = [since + datetime.timedelta(days=x) for x in range(n_days)]
+    dates = [since + datetime.timedelta(days=x) for x in range(n_days)]
     if only_active:
-        active_pairs = Pairing.objects.active(on_date=until).order_by("-began_on")
+        active_pairs = Pairing.objects.active(on_date=until)
     else:
-        active_pairs = Pairing.objects.active_between(since, until).order_by(
-            "-began_on"
+        active_pairs = Pairing.objects.active_between(since, until)
+    active_pairs = list(active_pairs.with_related().order_by("-began_on"))
+    # look up the progeny and locations of all the pairs at once instead of
+    # once per pair
+    parent_ids = {pair.sire_id for pair in active_pairs} | {
+        pair.dam_id for pair in active_pairs
+    }
+    child_parents = defaultdict(set)
+    children = []
+    last_events = {}
+    if active_pairs:
+        earliest = min(pair.began_on for pair in active_pairs)
+        progeny = (
+            Animal.objects.filter(
+                pk__in=Subquery(
+                    Parent.objects.filter(parent__in=parent_ids).values("child")
+                )
+            )
+            .with_dates()
+            .filter(first_event_on__gte=earliest)
         )
+        # only the dates and the species age table are needed to classify eggs
+        children = list(
+            progeny.select_related("species")
+            .only("uuid", "species__id")
+            .prefetch_related(
+                Prefetch(
+                    "species__age_set",
+                    queryset=Age.objects.only("species", "min_days", "name"),
+                )
+            )
+        )
+        # parent links for the children that could belong to one of the pairs
+        for child_id, parent_id in Parent.objects.filter(
+            child__in=Subquery(progeny.values("pk")), parent__in=parent_ids
+        ).values_list("child", "parent"):
+            child_parents[child_id].add(parent_id)
+        # the latest located event for each parent is enough: if it's before
+        # a pair began, so are all the others
+        last_events = {
+            event.animal_id: event
+            for event in Event.objects.has_location()
+            .filter(animal__in=parent_ids, date__gte=earliest, date__lte=until)
+            .latest_by_animal()
+            .select_related("location")
+        }
     data = []
     for pair in active_pairs:
-        location = pair.last_location(on_date=until)
-        eggs = pair.eggs().with_dates().with_related()
+        # same criteria as Pairing.last_location(on_date=until)
+        events = [
+            event
+            for animal_id in (pair.sire_id, pair.dam_id)
+            if (event := last_events.get(animal_id)) is not None
+            and event.date >= pair.began_on
+        ]
+        location = None
+        if events:
+            location = max(events, key=lambda e: (e.date, e.created)).location
+        # same criteria as Pairing.eggs()
+        eggs = [
+            animal
+            for animal in children
+            if {pair.sire_id, pair.dam_id} <= child_parents[animal.pk]
+            and animal.first_event_on >= pair.began_on
+            and (pair.ended_on is None or animal.first_event_on <= pair.ended_on)
+        ]
         days = []
         for date in dates:
             counts = Counter()
-            if pair.ended_on is not None and date > pair.ended_on:
+            # nothing to count if the pair has no eggs. Eggs are not laid before
+            # the pair began or counted after it ended
+            if not eggs or date < pair.began_on:
+                pass
+            elif pair.ended_on is not None and date > pair.ended_on:
                 pass
             else:
                 for animal in eggs:
@@ -8,7 +8,7 @@ from typing import Optional
 
 from django.contrib.auth.models import User
 from django.core.paginator import Paginator
-from django.db.models import Count, F
+from django.db.models import Count, F, Prefetch
 from django.db.utils import IntegrityError
 from django.forms import ValidationError, formset_factory
 from django.http import Http404, HttpResponseRedirect
@@ -75,6 +75,7 @@ def index(request):
 def animal_list(request):
     qs = (
         Animal.objects.with_annotations()
+        .with_child_counts()
         .with_related()
         .order_by("band_color", "band_number")
     )
@@ -101,14 +102,27 @@ def animal_list(request):
 
 @require_http_methods(["GET"])
 def animal_view(request, uuid: str):
-    qs = Animal.objects.with_annotations()
+    qs = (
+        Animal.objects.with_annotations()
+        .with_child_counts()
+        .with_expected_hatch()
+        .with_related()
+        .prefetch_related(
+            Prefetch(
+                "parents",
+                queryset=Animal.objects.select_related("species", "band_color"),
+            )
+        )
+    )
     animal = get_object_or_404(qs, uuid=uuid)
     kids = (
         animal.children.with_annotations()
+        .with_child_counts()
         .with_related()
+        .defer("attributes", "created", "plumage")
         .order_by("-alive", F("age").desc(nulls_last=True))
     )
-    events = animal.event_set.with_related().order_by("-date", "-created")
+    events = animal.event_set.with_related().with_age().order_by("-date", "-created")
     samples = animal.sample_set.order_by("-date")
     pairings = (
         animal.pairings().with_related().with_progeny_stats().order_by("-began_on")
@@ -132,12 +146,15 @@ def animal_genealogy(request, uuid: str):
     animal = get_object_or_404(Animal.objects.with_dates(), pk=uuid)
     generations = (1, 2, 3, 4)
     ancestors = [
-        Animal.objects.ancestors_of(animal, generation=gen).with_annotations()
+        Animal.objects.ancestors_of(animal, generation=gen)
+        .with_annotations()
+        .with_child_counts()
         for gen in generations
     ]
     descendents = [
         Animal.objects.descendents_of(animal, generation=gen)
         .with_annotations()
+        .with_child_counts()
         .hatched()
         .order_by("-alive", "-age")
         for gen in generations
@@ -418,20 +435,19 @@ def measurement_list(
 # Locations
 @require_http_methods(["GET"])
 def location_list(request):
-    # faster to query by bird and annotate with location (as in location_summary)
-    # qs = (
-    #     Animal.objects.with_annotations()
-    #     .with_related()
-    #     .alive()
-    #     .order_by("last_location")
-    # )
-    # counts = {}
-    # for location, animals in groupby(qs, key=lambda animal: animal.last_location):
-    #     counts[location] = len(animals)
     qs = Location.objects.order_by("name")
     paginator = Paginator(qs, 25)
     page_number = request.GET.get("page")
     page_obj = paginator.get_page(page_number)
+    # faster to query by bird and annotate with location (as in location_summary)
+    counts = Counter(
+        Animal.objects.with_location()
+        .alive()
+        .order_by()
+        .values_list("last_location", flat=True)
+    )
+    for location in page_obj.object_list:
+        location.n_alive = counts[location.name]
     return render(
         request,
         "birds/location_list.html",
@@ -442,9 +458,23 @@ def location_list(request):
 @require_http_methods(["GET"])
 def location_view(request, pk):
     location = get_object_or_404(Location, pk=pk)
-    birds = location.birds().with_dates().with_related().alive().order_by("-created")
-    eggs = location.birds().unhatched().existing().order_by("-created")
-    events = location.event_set.with_related()
+    birds = (
+        location.birds()
+        .with_dates()
+        .with_child_counts()
+        .with_related()
+        .alive()
+        .order_by("-created")
+    )
+    eggs = (
+        location.birds()
+        .unhatched()
+        .existing()
+        .with_expected_hatch()
+        .with_related()
+        .order_by("-created")
+    )
+    events = location.event_set.with_related().with_age()
     return render(
         request,
         "birds/location.html",
@@ -476,7 +506,10 @@ def user_list(request):
 def user_view(request, pk):
     user = get_object_or_404(User, pk=pk)
     reserved = (
-        user.animal_set.with_annotations().with_related().order_by("-alive", "-age")
+        user.animal_set.with_annotations()
+        .with_child_counts()
+        .with_related()
+        .order_by("-alive", "-age")
     )
     query = request.GET.copy()
     try:
@@ -541,11 +574,19 @@ def pairing_view(request, pk):
     progeny = (
         pair.eggs()
         .with_annotations()
+        .with_child_counts()
         .with_related()
         .hatched()
         .order_by("-alive", "-created")
     )
-    eggs = pair.eggs().with_annotations().with_related().unhatched().order_by("created")
+    eggs = (
+        pair.eggs()
+        .with_annotations()
+        .with_expected_hatch()
+        .with_related()
+        .unhatched()
+        .order_by("created")
+    )
     pairings = pair.other_pairings().with_progeny_stats()
     events = pair.events().with_related()
     return render(